@@ -1,4 +1,5 @@
 import argparse
+import bisect
 import copy
 import errno
 import json
@@ -8,7 +9,6 @@ import subprocess
 import sys
 import urllib.error
 from datetime import datetime, timezone
-from pathlib import Path
 from textwrap import dedent
 from typing import get_args
 from urllib.parse import urlparse
@@ -405,52 +405,27 @@ def logout_cli(args):
     return model.logout(args)
 
 
+# (divisor, unit) for human_duration, each used from its divisor up to the next one
+DURATION_UNITS = (
+    (1, "second"),
+    (60, "minute"),
+    (3600, "hour"),
+    (86400, "day"),
+    (604800, "week"),
+    (2419200, "month"),
+    (31536000, "year"),
+)
+DURATION_THRESHOLDS = tuple(divisor for divisor, _ in DURATION_UNITS)
+
+
 def human_duration(d):
-    if d < 1:
+    i = bisect.bisect_right(DURATION_THRESHOLDS, d)
+    if i == 0:
         return "Less than a second"
-    if d == 1:
-        return "1 second"
-    if d < 60:
-        return f"{d} seconds"
-    if d < 120:
-        return "1 minute"
-    if d < 3600:
-        return f"{d // 60} minutes"
-    if d < 7200:
-        return "1 hour"
-    if d < 86400:
-        return f"{d // 3600} hours"
-    if d < 172800:
-        return "1 day"
-    if d < 604800:
-        return f"{d // 86400} days"
-    if d < 1209600:
-        return "1 week"
-    if d < 2419200:
-        return f"{d // 604800} weeks"
-    if d < 4838400:
-        return "1 month"
-    if d < 31536000:
-        return f"{d // 2419200} months"
-    return "1 year" if d < 63072000 else f"{d // 31536000} years"
-
-
-def list_files_by_modification(args):
-    paths = Path().rglob("*")
-    models = []
-    for path in paths:
-        if str(path).startswith("file/"):
-            if not os.path.exists(str(path)):
-                path = str(path).replace("file/", "file:///")
-                perror(f"{path} does not exist")
-                continue
-        if os.path.exists(path):
-            models.append(path)
-        else:
-            perror(f"Broken symlink found in: {args.store}/models/{path} \nAttempting removal")
-            New(str(path).replace("/", "://", 1), args).remove(args)
 
-    return sorted(models, key=lambda p: os.path.getmtime(p), reverse=True)
+    divisor, unit = DURATION_UNITS[i - 1]
+    count = d // divisor
+    return f"1 {unit}" if count == 1 else f"{count} {unit}s"
 
 
 def bench_cli(args):
@@ -1,6 +1,5 @@
 import json
 import os
-import re
 import tempfile
 import urllib.request
 from abc import ABC, abstractmethod
@@ -26,7 +25,7 @@ class HFStyleRepoFile(SnapshotFile):
     ):
         super().__init__(url, header, hash, name, type, should_show_progress, should_verify_checksum, required)
 
-    def download(self, blob_file_path, snapshot_dir):
+    def download(self, blob_file_path, snapshot_dir, cancel_event=None):
         # moving from the cached temp directory to blob directory
         import shutil
 
@@ -93,7 +92,7 @@ class HFStyleRepository(ABC):
         assert self.model_filename
         if is_split_file_model(self.model_filename):
             # If the model is split, we need to add all parts
-            match = re.match(SPLIT_MODEL_PATH_RE, self.model_filename)
+            match = SPLIT_MODEL_PATH_RE.match(self.model_filename)
             if match:
                 path_part = match[1]
                 if path_part:
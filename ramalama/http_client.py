@@ -3,6 +3,7 @@
 import os
 import shutil
 import sys
+import threading
 import time
 import urllib.request
 
@@ -15,11 +16,15 @@ HTTP_NOT_FOUND = 404
 HTTP_RANGE_NOT_SATISFIABLE = 416  # "Range Not Satisfiable" error (file already downloaded)
 
 
+class DownloadCancelledError(Exception):
+    pass
+
+
 class HttpClient:
     def __init__(self):
         pass
 
-    def init(self, url, headers, output_file, show_progress, response_str=None):
+    def init(self, url, headers, output_file, show_progress, response_str=None, cancel_event=None):
         output_file_partial = None
         if output_file:
             output_file_partial = output_file + ".partial"
@@ -39,13 +44,14 @@ class HttpClient:
 
             self.now_downloaded = 0
             self.start_time = time.time()
-            self.perform_download(out.file, show_progress)
+            self.perform_download(out.file, show_progress, cancel_event)
 
         if output_file:
             os.rename(output_file_partial, output_file)
 
     def urlopen(self, url, headers):
-        headers["Range"] = f"bytes={self.file_size}-"
+        # build a new dict, the caller's headers may be shared with concurrent downloads
+        headers = {**headers, "Range": f"bytes={self.file_size}-"}
         logger.debug(f"Running urlopen {url} with headers: {headers}")
         request = urllib.request.Request(url, headers=headers)
         self.response = urllib.request.urlopen(request)
@@ -53,7 +59,7 @@ class HttpClient:
         if self.response.status not in (200, 206):
             raise IOError(f"Request failed: {self.response.status}")
 
-    def perform_download(self, file, show_progress):
+    def perform_download(self, file, show_progress, cancel_event=None):
         self.total_to_download += self.file_size
         self.now_downloaded = 0
         self.start_time = time.time()
@@ -61,6 +67,9 @@ class HttpClient:
         last_update_time = time.time()
         try:
             while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise DownloadCancelledError("Download cancelled")
+
                 data = self.response.read(1024)
                 if not data:
                     break
@@ -154,7 +163,13 @@ class HttpClient:
         return now_downloaded / elapsed_seconds
 
 
-def download_file(url: str, dest_path: str, headers: dict[str, str] | None = None, show_progress: bool = True):
+def download_file(
+    url: str,
+    dest_path: str,
+    headers: dict[str, str] | None = None,
+    show_progress: bool = True,
+    cancel_event: threading.Event | None = None,
+):
     """
     Downloads a file from a given URL to a specified destination path.
 
@@ -163,9 +178,11 @@ def download_file(url: str, dest_path: str, headers: dict[str, str] | None = Non
         dest_path (str): The path to save the downloaded file.
         headers (dict): Optional headers to include in the request.
         show_progress (bool): Whether to show a progress bar during download.
+        cancel_event (threading.Event): Optional event which aborts the download once set.
 
     Raises:
         RuntimeError: If the download fails after multiple attempts.
+        DownloadCancelledError: If cancel_event was set; the partial file is kept for resuming.
     """
     headers = headers or {}
 
@@ -178,15 +195,27 @@ def download_file(url: str, dest_path: str, headers: dict[str, str] | None = Non
     retries = 0
 
     while retries < max_retries:
+        if cancel_event is not None and cancel_event.is_set():
+            raise DownloadCancelledError("Download cancelled")
+
         try:
             # Initialize HTTP client for the request
-            http_client.init(url=url, headers=headers, output_file=dest_path, show_progress=show_progress)
+            http_client.init(
+                url=url,
+                headers=headers,
+                output_file=dest_path,
+                show_progress=show_progress,
+                cancel_event=cancel_event,
+            )
             return  # Exit function if successful
 
         except KeyboardInterrupt:
             perror("\nDownload interrupted by user. Exiting cleanly.")
             raise
 
+        except DownloadCancelledError:
+            raise
+
         except urllib.error.HTTPError as e:
             if e.code in [HTTP_RANGE_NOT_SATISFIABLE, HTTP_NOT_FOUND]:
                 raise e
@@ -34,56 +34,50 @@ class Kube:
         self.image = args.image
 
     def _gen_volumes(self):
-        mounts = """\
-        volumeMounts:"""
+        mounts = ["""\
+        volumeMounts:"""]
 
-        volumes = """
-      volumes:"""
+        volumes = ["""
+      volumes:"""]
+
+        def add(mount_volume: Tuple[str, str]):
+            mounts.append(mount_volume[0])
+            volumes.append(mount_volume[1])
 
         if os.path.exists(self.src_model_path):
-            m, v = self._gen_path_volume()
-            mounts += m
-            volumes += v
+            add(self._gen_path_volume())
         else:
-            mounts += f"""
+            mounts.append(f"""
         - mountPath: {MNT_DIR}
           subPath: /models
-          name: model"""
-            volumes += self._gen_oci_volume()
+          name: model""")
+            volumes.append(self._gen_oci_volume())
 
         if self.args.rag:
-            m, v = self._gen_rag_volume()
-            mounts += m
-            volumes += v
+            add(self._gen_rag_volume())
 
         if self.src_chat_template_path and os.path.exists(self.src_chat_template_path):
-            m, v = self._gen_chat_template_volume()
-            mounts += m
-            volumes += v
+            add(self._gen_chat_template_volume())
 
         if self.src_mmproj_path and os.path.exists(self.src_mmproj_path):
-            m, v = self._gen_mmproj_volume()
-            mounts += m
-            volumes += v
+            add(self._gen_mmproj_volume())
 
-        m, v = self._gen_devices()
-        mounts += m
-        volumes += v
-        return mounts + volumes
+        add(self._gen_devices())
+        return "".join(mounts + volumes)
 
     def _gen_devices(self):
-        mounts = ""
-        volumes = ""
+        mounts = []
+        volumes = []
         for dev in ["dri", "kfd"]:
             if os.path.exists("/dev/" + dev):
-                mounts += f"""
+                mounts.append(f"""
         - mountPath: /dev/{dev}
-          name: {dev}"""
-                volumes += f"""
+          name: {dev}""")
+                volumes.append(f"""
       - hostPath:
           path: /dev/{dev}
-        name: {dev}"""
-        return mounts, volumes
+        name: {dev}""")
+        return "".join(mounts), "".join(volumes)
 
     def _gen_path_volume(self):
         mount = f"""
@@ -156,15 +150,15 @@ class Kube:
         if not env_vars:
             return ""
 
-        env_spec = """\
-        env:"""
+        env_spec = ["""\
+        env:"""]
 
         for k, v in env_vars.items():
-            env_spec += f"""
+            env_spec.append(f"""
         - name: {k}
-          value: {v}"""
+          value: {v}""")
 
-        return env_spec
+        return "".join(env_spec)
 
     def generate(self) -> PlainFile:
         env_string = self.__gen_env_vars()
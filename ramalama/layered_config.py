@@ -1,6 +1,6 @@
 from dataclasses import MISSING, fields, is_dataclass
 from functools import reduce
-from typing import Any, Type, get_type_hints
+from typing import Any, Collection, Type, get_type_hints
 
 
 def deep_merge(left: dict, right: dict) -> dict:
@@ -13,9 +13,11 @@ def deep_merge(left: dict, right: dict) -> dict:
     return left
 
 
-def extract_defaults(cls) -> dict[str, Any]:
+def extract_defaults(cls, exclude: Collection[str] = ()) -> dict[str, Any]:
     result = {}
     for f in fields(cls):
+        if f.name in exclude:
+            continue
         if f.default is not MISSING:
             result[f.name] = f.default
         elif f.default_factory is not MISSING:  # type: ignore
@@ -45,9 +47,11 @@ class LayeredMixin:
         self._fields = {f.name for f in fields(self.__class__)}  # type: ignore[arg-type]
         self._layers = [{k: layer[k] for k in layer.keys() & self._fields} for layer in layers]
 
-        defaults = extract_defaults(self.__class__)
-        merged = defaults | reduce(deep_merge, reversed(self._layers))
-        super().__init__(**build_subconfigs(merged, type(self)))
+        merged = reduce(deep_merge, reversed(self._layers))
+        # Only evaluate defaults of fields no layer sets, some default factories probe the
+        # host, e.g. the engine default looks up podman and docker in $PATH
+        defaults = extract_defaults(self.__class__, exclude=merged.keys())
+        super().__init__(**build_subconfigs(defaults | merged, type(self)))
 
     def is_set(self, name: str) -> bool:
         return any(name in layer for layer in self._layers)
@@ -58,20 +58,22 @@ class GlobalModelStore:
                         snapshot_file_path = os.path.join(
                             root, DIRECTORY_NAME_SNAPSHOTS, ref_file.hash, snapshot_file.name
                         )
-                        if not os.path.exists(snapshot_file_path):
+                        # a single stat provides existence, modification time and size
+                        try:
+                            stat = os.stat(snapshot_file_path)
+                        except OSError:
                             blobs_partial_file_path = os.path.join(
                                 root, DIRECTORY_NAME_BLOBS, ref_file.hash + ".partial"
                             )
-                            if not os.path.exists(blobs_partial_file_path):
+                            try:
+                                stat = os.stat(blobs_partial_file_path)
+                            except OSError:
                                 continue
 
-                            snapshot_file_path = blobs_partial_file_path
                             is_partially_downloaded = True
 
-                        last_modified = os.path.getmtime(snapshot_file_path)
-                        file_size = os.path.getsize(snapshot_file_path)
                         collected_files.append(
-                            ModelFile(snapshot_file.name, last_modified, file_size, is_partially_downloaded)
+                            ModelFile(snapshot_file.name, stat.st_mtime, stat.st_size, is_partially_downloaded)
                         )
                     models[model_name] = collected_files
 
@@ -179,6 +179,10 @@ GO_KEYWORDS: Dict[NodeType, re.Pattern] = {
     NodeType.CONTINUE: re.compile(R"{}".format(REGEX_NODE_CONTINUE), re.S),
     NodeType.BREAK: re.compile(R"{}".format(REGEX_NODE_BREAK), re.S),
 }
+VARIABLE_PATTERN = re.compile(R"{}".format(REGEX_VARIABLE))
+LOCAL_VARIABLE_PATTERN = re.compile(R"{}".format(REGEX_LOCAL_VARIABLE))
+JINJA_TEMPLATE_PATTERN = re.compile(R".*{%\-?.+\-?%}", re.S)
+GO_TEMPLATE_PATTERN = re.compile(R".*{{\-?.+\-?}}", re.S)
 
 
 def detect_node_type(stmt: str) -> Optional[NodeType]:
@@ -318,11 +322,11 @@ def parse_go_template(content: str) -> list[Node]:
 
 
 def is_jinja_template(content: str) -> bool:
-    return re.compile(R".*{%\-?.+\-?%}", re.S).match(content) is not None
+    return JINJA_TEMPLATE_PATTERN.match(content) is not None
 
 
 def is_go_template(content: str) -> bool:
-    return re.compile(R".*{{\-?.+\-?}}", re.S).match(content) is not None and not is_jinja_template(content)
+    return GO_TEMPLATE_PATTERN.match(content) is not None and not is_jinja_template(content)
 
 
 def go_to_jinja(content: str) -> str:
@@ -346,15 +350,13 @@ def go_to_jinja(content: str) -> str:
     def parse_pipeline(pipeline: str) -> str:
 
         def parse_variable(pipeline: str) -> str:
-            reg = re.compile(R"{}".format(f"{REGEX_VARIABLE}"))
-            m = reg.match(pipeline)
+            m = VARIABLE_PATTERN.match(pipeline)
             if m is not None:
                 start, end = m.span()
                 if start == 0 and end == (len(pipeline)):
                     return transform_go_var_to_jinja(pipeline)
 
-            reg = re.compile(R"{}".format(f"{REGEX_LOCAL_VARIABLE}"))
-            m = reg.match(pipeline)
+            m = LOCAL_VARIABLE_PATTERN.match(pipeline)
             if m is not None:
                 start, end = m.span()
                 if start == 0 and end == (len(pipeline)):
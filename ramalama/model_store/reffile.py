@@ -5,7 +5,7 @@ from enum import StrEnum
 from pathlib import Path
 from typing import Optional
 
-from ramalama.common import generate_sha256, sanitize_filename
+from ramalama.common import generate_sha256, json_loads, sanitize_filename
 from ramalama.logger import logger
 
 
@@ -171,6 +171,7 @@ class RefJSONFile:
         return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=2)
 
     def write_to_file(self):
+        _ref_json_cache.pop(self.path, None)
         with open(self.path, "w") as file:
             file.write(self.to_json())
             file.flush()
@@ -199,22 +200,39 @@ class RefJSONFile:
 
     @staticmethod
     def from_path(path: str) -> "RefJSONFile":
-        with open(path, "r") as f:
-            data = json.loads(f.read())
-
-            ref_version = data["version"]
-            ref_hash = data["hash"]
-            ref_path = data["path"]
-            ref_files = []
-            for file in data["files"]:
-                file_hash = file["hash"]
-                file_name = file["name"]
-                file_type = StoreFileType.from_str(file["type"])
-                ref_files.append(StoreFile(file_hash, file_name, file_type))
-
-            return RefJSONFile(
-                version=ref_version,
-                hash=ref_hash,
-                path=ref_path,
-                files=ref_files,
-            )
+        data = _load_ref_json(path)
+
+        ref_version = data["version"]
+        ref_hash = data["hash"]
+        ref_path = data["path"]
+        ref_files = []
+        for file in data["files"]:
+            file_hash = file["hash"]
+            file_name = file["name"]
+            file_type = StoreFileType.from_str(file["type"])
+            ref_files.append(StoreFile(file_hash, file_name, file_type))
+
+        return RefJSONFile(
+            version=ref_version,
+            hash=ref_hash,
+            path=ref_path,
+            files=ref_files,
+        )
+
+
+# Parsed ref file contents by path, together with the (mtime, size) they were read at.
+# The same ref file is read several times during a single command, e.g. by run pulling a model first.
+_ref_json_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+def _load_ref_json(path: str) -> dict:
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _ref_json_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        data = json_loads(f.read())
+    _ref_json_cache[path] = (key, data)
+    return data
@@ -1,8 +1,9 @@
 import os
+import threading
 from enum import IntEnum
-from typing import Dict, Sequence
+from typing import Dict, Optional, Sequence
 
-from ramalama.common import generate_sha256, perror
+from ramalama.common import checksum_marker_path, generate_sha256, perror
 from ramalama.http_client import download_file
 from ramalama.logger import logger
 
@@ -26,6 +27,7 @@ class SnapshotFile:
         should_show_progress: bool = False,
         should_verify_checksum: bool = False,
         required: bool = True,
+        size: Optional[int] = None,
     ):
         self.url: str = url
         self.header: Dict = header
@@ -35,9 +37,27 @@ class SnapshotFile:
         self.should_show_progress: bool = should_show_progress
         self.should_verify_checksum: bool = should_verify_checksum
         self.required: bool = required
+        self.size: Optional[int] = size
 
-    def download(self, blob_file_path: str, snapshot_dir: str) -> str:
-        if not os.path.exists(blob_file_path):
+    def download(
+        self, blob_file_path: str, snapshot_dir: str, cancel_event: Optional[threading.Event] = None
+    ) -> str:
+        try:
+            cached_size: Optional[int] = os.stat(blob_file_path).st_size
+        except FileNotFoundError:
+            cached_size = None
+
+        # a cached blob with a different size than announced is incomplete or corrupt
+        if cached_size is not None and self.size is not None and cached_size != self.size:
+            logger.debug(f"Cached blob for {self.name} has size {cached_size}, expected {self.size}; downloading again")
+            os.remove(blob_file_path)
+            try:
+                os.remove(checksum_marker_path(blob_file_path))
+            except FileNotFoundError:
+                pass
+            cached_size = None
+
+        if cached_size is None:
             if self.should_show_progress:
                 perror(f"Downloading {self.name}")
             download_file(
@@ -45,6 +65,7 @@ class SnapshotFile:
                 headers=self.header,
                 dest_path=blob_file_path,
                 show_progress=self.should_show_progress,
+                cancel_event=cancel_event,
             )
         else:
             logger.debug(f"Using cached blob for {self.name} ({os.path.basename(blob_file_path)})")
@@ -76,7 +97,7 @@ class LocalSnapshotFile(SnapshotFile):
         )
         self.content = content
 
-    def download(self, blob_file_path, snapshot_dir):
+    def download(self, blob_file_path, snapshot_dir, cancel_event=None):
         with open(blob_file_path, "w") as file:
             file.write(self.content)
             file.flush()
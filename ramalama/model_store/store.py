@@ -1,12 +1,21 @@
 import os
 import shutil
+import threading
 import urllib.error
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from pathlib import Path
 from typing import Optional, Sequence, Tuple
 
-from ramalama.common import perror, sanitize_filename, verify_checksum
+from ramalama.common import (
+    atomic_symlink,
+    checksum_marker_path,
+    perror,
+    sanitize_filename,
+    verify_checksum,
+    verify_checksums,
+)
 from ramalama.endian import EndianMismatchError, get_system_endianness
 from ramalama.logger import logger
 from ramalama.model_inspect.gguf_parser import GGUFInfoParser, GGUFModelInfo
@@ -27,6 +36,8 @@ from ramalama.model_store.template_conversion import (
     is_openai_jinja,
 )
 
+MAX_CONCURRENT_DOWNLOADS = 8
+
 
 def map_to_store_file_type(snapshot_type: SnapshotFileType) -> StoreFileType:
     mapping = {
@@ -218,38 +229,88 @@ class ModelStore:
     def _download_snapshot_files(
         self, ref_file: RefJSONFile, snapshot_hash: str, snapshot_files: Sequence[SnapshotFile]
     ):
-        for file in snapshot_files:
-            dest_path = self.get_blob_file_path(file.hash)
-            blob_relative_path = ""
-            try:
-                blob_relative_path = file.download(dest_path, self.get_snapshot_directory(snapshot_hash))
-            except urllib.error.HTTPError as ex:
-                if file.required:
-                    raise ex
-                # remove file from ref file list to prevent a retry to download it
-                if ex.code == HTTPStatus.NOT_FOUND:
-                    ref_file.remove_file(file.hash)
-                continue
+        # Files without a progress bar are small (configs, templates, ...) and are fetched in the
+        # background while the remaining files download, so their request latencies overlap.
+        # Blobs shared by several files are left to the sequential path to avoid racing on them.
+        hash_counts = Counter(file.hash for file in snapshot_files)
+        background_files = [
+            file for file in snapshot_files if not file.should_show_progress and hash_counts[file.hash] == 1
+        ]
 
-            if file.should_verify_checksum:
-                if not verify_checksum(dest_path):
-                    logger.info(f"Checksum mismatch for blob {dest_path}, retrying download ...")
-                    os.remove(dest_path)
-                    file.download(dest_path, self.get_snapshot_directory(snapshot_hash))
-                    if not verify_checksum(dest_path):
-                        raise ValueError(f"Checksum verification failed for blob {dest_path}")
+        snapshot_directory = self.get_snapshot_directory(snapshot_hash)
+        downloaded_files: list[tuple[SnapshotFile, str, str]] = []
+        cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS)
+        futures = {
+            file: executor.submit(
+                file.download, self.get_blob_file_path(file.hash), snapshot_directory, cancel_event=cancel_event
+            )
+            for file in background_files
+        }
+        try:
+            for file in snapshot_files:
+                dest_path = self.get_blob_file_path(file.hash)
+                blob_relative_path = ""
+                try:
+                    if file in futures:
+                        blob_relative_path = futures[file].result()
+                    else:
+                        blob_relative_path = file.download(dest_path, snapshot_directory)
+                except urllib.error.HTTPError as ex:
+                    if file.required:
+                        raise ex
+                    # remove file from ref file list to prevent a retry to download it
+                    if ex.code == HTTPStatus.NOT_FOUND:
+                        ref_file.remove_file(file.hash)
+                    continue
+
+                downloaded_files.append((file, dest_path, blob_relative_path))
+        except BaseException:
+            # abort running background downloads and drop queued ones, e.g. on Ctrl-C, so that
+            # neither this call nor the interpreter's exit waits for their worker threads
+            cancel_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        self._verify_snapshot_files(
+            snapshot_hash,
+            [(file, dest_path) for file, dest_path, _ in downloaded_files if file.should_verify_checksum],
+        )
 
+        # most files share the snapshot directory, only create each link directory once
+        link_directories: set[str] = set()
+        for file, _, blob_relative_path in downloaded_files:
             link_path = self.get_snapshot_file_path(snapshot_hash, file.name)
-            os.makedirs(os.path.dirname(link_path), exist_ok=True)
-            try:
-                os.symlink(blob_relative_path, link_path)
-            except FileExistsError:
-                os.unlink(link_path)
-                os.symlink(blob_relative_path, link_path)
+            link_directory = os.path.dirname(link_path)
+            if link_directory not in link_directories:
+                os.makedirs(link_directory, exist_ok=True)
+                link_directories.add(link_directory)
+            atomic_symlink(blob_relative_path, link_path)
 
         # save updated ref file
         ref_file.write_to_file()
 
+    def _verify_snapshot_files(self, snapshot_hash: str, files: list[tuple[SnapshotFile, str]]):
+        if not files:
+            return
+
+        # files sharing a blob are verified (and re-downloaded) only once
+        files_by_path: dict[str, SnapshotFile] = {}
+        for file, dest_path in files:
+            files_by_path.setdefault(dest_path, file)
+
+        results = verify_checksums(list(files_by_path))
+        for (dest_path, file), is_valid in zip(files_by_path.items(), results):
+            if is_valid:
+                continue
+
+            logger.info(f"Checksum mismatch for blob {dest_path}, retrying download ...")
+            os.remove(dest_path)
+            file.download(dest_path, self.get_snapshot_directory(snapshot_hash))
+            if not verify_checksum(dest_path):
+                raise ValueError(f"Checksum verification failed for blob {dest_path}")
+
     def _try_convert_existing_chat_template(self, ref_file: RefJSONFile, snapshot_hash: str) -> bool:
         for file in ref_file.chat_templates:
             chat_template_file_path = self.get_blob_file_path(file.hash)
@@ -403,6 +464,10 @@ class ModelStore:
         try:
             if os.path.exists(blob_path) and Path(self.base_path) in blob_path.parents:
                 os.remove(blob_path)
+                try:
+                    os.remove(checksum_marker_path(str(blob_path)))
+                except FileNotFoundError:
+                    pass
                 logger.debug(f"Removed blob for '{snapshot_file_path}'")
         except Exception as ex:
             logger.error(f"Failed to remove blob file '{blob_path}': {ex}")
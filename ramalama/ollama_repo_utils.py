@@ -1,8 +1,7 @@
-import json
 import os
 import urllib.request
 
-from ramalama.common import perror, run_cmd, verify_checksum
+from ramalama.common import atomic_symlink, json_loads, perror, verify_checksum
 from ramalama.http_client import download_file
 from ramalama.logger import logger
 
@@ -25,7 +24,7 @@ def fetch_manifest_data(registry_head, model_tag, accept):
     logger.debug(f"Fetching manifest data from url {url}")
     request = urllib.request.Request(url, headers=headers)
     with urllib.request.urlopen(request) as response:
-        manifest_data = json.load(response)
+        manifest_data = json_loads(response.read())
     return manifest_data
 
 
@@ -88,7 +87,7 @@ def pull_blob(
         local_blob = in_existing_cache_fn(model_name, model_tag)
 
     if local_blob is not None:
-        run_cmd(["ln", "-sf", local_blob, layer_blob_path])
+        atomic_symlink(local_blob, layer_blob_path)
     else:
         download_file(url, layer_blob_path, headers=headers, show_progress=show_progress)
         # Verify checksum after downloading the blob
@@ -100,7 +99,7 @@ def pull_blob(
                 raise ValueError(f"Checksum verification failed for blob {layer_blob_path}")
 
     relative_target_path = os.path.relpath(layer_blob_path, start=os.path.dirname(model_path))
-    run_cmd(["ln", "-sf", relative_target_path, model_path])
+    atomic_symlink(relative_target_path, model_path)
 
 
 def repo_pull(
@@ -2,6 +2,9 @@ import re
 
 from ramalama.logger import logger
 
+INT_VALUE_RE = re.compile(r'^\d+$')
+FLOAT_VALUE_RE = re.compile(r'^\d+\.\d+$')
+
 
 class TOMLParser:
     def __init__(self):
@@ -53,9 +56,9 @@ class TOMLParser:
             return value[1:-1]
         if value.startswith("[") and value.endswith("]"):
             return [self._parse_value(v.strip()) for v in value[1:-1].split(",")]
-        if re.match(r'^\d+$', value):
+        if INT_VALUE_RE.match(value):
             return int(value)
-        if re.match(r'^\d+\.\d+$', value):
+        if FLOAT_VALUE_RE.match(value):
             return float(value)
         if value.lower() in {"true", "false"}:
             return value.lower() == "true"
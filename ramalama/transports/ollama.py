@@ -1,10 +1,9 @@
-import json
 import os
 import shutil
 import urllib.error
 from typing import Optional
 
-from ramalama.common import available, perror
+from ramalama.common import atomic_symlink, available, json_loads, perror
 from ramalama.model_store.snapshot_file import SnapshotFile, SnapshotFileType
 from ramalama.ollama_repo_utils import fetch_manifest_data
 from ramalama.transports.base import Transport
@@ -22,8 +21,8 @@ def in_existing_cache(model_name, model_tag):
     for cache_dir in default_ollama_caches:
         manifest_path = os.path.join(cache_dir, 'manifests', 'registry.ollama.ai', model_name, model_tag)
         if os.access(manifest_path, os.R_OK):
-            with open(manifest_path, 'r') as file:
-                manifest_data = json.load(file)
+            with open(manifest_path, 'rb') as file:
+                manifest_data = json_loads(file.read())
                 for layer in manifest_data["layers"]:
                     if layer["mediaType"] == "application/vnd.ollama.image.model":
                         layer_digest = layer["digest"]
@@ -82,6 +81,12 @@ class OllamaRepository:
                 return layer_digest
         return ""
 
+    def get_layer_size(self, manifest, digest) -> Optional[int]:
+        for layer in manifest["layers"]:
+            if layer["digest"] == digest:
+                return layer.get("size")
+        return None
+
     def model_file(self, tag, manifest=None) -> Optional[SnapshotFile]:
         if manifest is None:
             manifest = self.fetch_manifest(tag)
@@ -98,6 +103,7 @@ class OllamaRepository:
             name=self.name,
             should_show_progress=True,
             should_verify_checksum=True,
+            size=self.get_layer_size(manifest, model_digest),
         )
 
     def config_file(self, tag, manifest=None) -> SnapshotFile:
@@ -112,6 +118,7 @@ class OllamaRepository:
             hash=config_hash,
             type=SnapshotFileType.Other,
             name=OllamaRepository.FILE_NAME_CONFIG,
+            size=manifest["config"].get("size"),
         )
 
     def get_chat_template_hash(self, manifest) -> str:
@@ -135,6 +142,7 @@ class OllamaRepository:
             hash=chat_template_digest,
             type=SnapshotFileType.ChatTemplate,
             name=OllamaRepository.FILE_NAME_CHAT_TEMPLATE,
+            size=self.get_layer_size(manifest, chat_template_digest),
         )
 
 
@@ -182,7 +190,9 @@ class Ollama(Transport):
         manifest = ollama_repo.fetch_manifest(tag)
         ollama_cache_path = in_existing_cache(self.model_name, tag)
         is_model_in_ollama_cache = ollama_cache_path is not None
-        files: list[SnapshotFile] = ollama_repo.get_file_list(tag, cached_files, is_model_in_ollama_cache)
+        files: list[SnapshotFile] = ollama_repo.get_file_list(
+            tag, cached_files, is_model_in_ollama_cache, manifest=manifest
+        )
 
         if not args.quiet:
             self.print_pull_message(f"ollama://{organization}/{name}:{tag}")
@@ -195,4 +205,4 @@ class Ollama(Transport):
             if not args.quiet:
                 perror(f"Using cached ollama://{name}{tag} ...")
             snapshot_model_path = self.model_store.get_snapshot_file_path(model_hash, self.model_store.model_name)
-            os.symlink(ollama_cache_path, snapshot_model_path)
+            atomic_symlink(ollama_cache_path, snapshot_model_path)
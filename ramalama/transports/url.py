@@ -1,5 +1,4 @@
 import os
-import re
 import shutil
 
 from ramalama.common import SPLIT_MODEL_PATH_RE, generate_sha256, is_split_file_model
@@ -31,7 +30,7 @@ class LocalModelFile(SnapshotFile):
             required,
         )
 
-    def download(self, blob_file_path, snapshot_dir):
+    def download(self, blob_file_path, snapshot_dir, cancel_event=None):
         if not os.path.exists(self.url):
             raise FileNotFoundError(f"No such file: '{self.url}'")
         # moving from the local location to blob directory so the model store "owns" the data
@@ -79,7 +78,7 @@ class URL(Transport):
         files: list[SnapshotFile] = []
 
         # model is split, lets fetch all files based on the name pattern
-        match = re.match(SPLIT_MODEL_PATH_RE, self.model)
+        match = SPLIT_MODEL_PATH_RE.match(self.model)
         if match is None:
             return files
 
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import shutil
 import subprocess
@@ -11,13 +12,17 @@ import pytest
 
 from ramalama.cli import configure_subcommands, create_argument_parser
 from ramalama.common import (
+    CHECKSUM_CHUNK_SIZE,
     accel_image,
+    atomic_symlink,
+    checksum_marker_path,
     find_in_cdi,
     get_accel,
     load_cdi_config,
     populate_volume_from_image,
     rm_until_substring,
     verify_checksum,
+    verify_checksums,
 )
 from ramalama.config import DEFAULT_IMAGE, default_config
 
@@ -62,6 +67,9 @@ I have been tampered with
 
 """  # noqa: E501
 
+# spans multiple read chunks of verify_checksum
+large_input = "RamaLama" * ((CHECKSUM_CHUNK_SIZE // 8) + 1)
+
 
 @pytest.mark.parametrize(
     "input_file_name,content,expected_error,expected_result",
@@ -71,6 +79,8 @@ I have been tampered with
         ("sha256:62fbfd9ed093d6e5ac83190c86eec5369317919f4b149598d2dbb38900e9faef", valid_input, None, True),
         ("sha256-62fbfd9ed093d6e5ac83190c86eec5369317919f4b149598d2dbb38900e9faef", valid_input, None, True),
         ("sha256:16cd1aa2bd52b0e87ff143e8a8a7bb6fcb0163c624396ca58e7f75ec99ef081f", tampered_input, None, False),
+        (f"sha256-{hashlib.sha256(large_input.encode()).hexdigest()}", large_input, None, True),
+        ("sha256-e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855", "", None, True),
     ],
 )
 def test_verify_checksum(
@@ -98,6 +108,47 @@ def test_verify_checksum(
         shutil.rmtree(full_dir_path)
 
 
+def test_atomic_symlink_replaces_existing_link(tmp_path):
+    link_path = str(tmp_path / "link")
+
+    atomic_symlink("first", link_path)
+    assert os.readlink(link_path) == "first"
+
+    atomic_symlink("second", link_path)
+    assert os.readlink(link_path) == "second"
+    assert os.listdir(tmp_path) == ["link"]
+
+
+def test_verify_checksums(tmp_path):
+    valid_path = tmp_path / "sha256-62fbfd9ed093d6e5ac83190c86eec5369317919f4b149598d2dbb38900e9faef"
+    valid_path.write_text(valid_input)
+    tampered_path = tmp_path / "sha256-16cd1aa2bd52b0e87ff143e8a8a7bb6fcb0163c624396ca58e7f75ec99ef081f"
+    tampered_path.write_text(tampered_input)
+    missing_path = tmp_path / "sha256-e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+    assert verify_checksums([]) == []
+    assert verify_checksums([str(valid_path)]) == [True]
+    assert verify_checksums([str(valid_path), str(tampered_path), str(missing_path)]) == [True, False, False]
+
+
+def test_verify_checksum_skips_rehash_for_unchanged_file(tmp_path):
+    file_path = tmp_path / "sha256-62fbfd9ed093d6e5ac83190c86eec5369317919f4b149598d2dbb38900e9faef"
+    file_path.write_text(valid_input)
+
+    assert verify_checksum(str(file_path))
+    assert os.path.exists(checksum_marker_path(str(file_path)))
+
+    # same size and mtime: the marker is trusted and the content is not hashed again
+    stat = file_path.stat()
+    file_path.write_text(valid_input.swapcase())
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert verify_checksum(str(file_path))
+
+    # a changed mtime invalidates the marker
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert not verify_checksum(str(file_path))
+
+
 DEFAULT_IMAGES = {
     "HIP_VISIBLE_DEVICES": "quay.io/ramalama/rocm",
 }
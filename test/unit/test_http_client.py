@@ -0,0 +1,47 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from ramalama.http_client import download_file
+
+
+class FakeResponse:
+    status = 206
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def getheader(self, name, default=None):
+        return default
+
+    def read(self, size=-1):
+        data, self.content = self.content, b""
+        return data
+
+
+def test_concurrent_downloads_do_not_share_range_header(tmp_path):
+    resumed_path = tmp_path / "resumed"
+    (tmp_path / "resumed.partial").write_bytes(b"Rama")
+    fresh_path = tmp_path / "fresh"
+
+    shared_headers = {"Authorization": "Bearer token"}
+    both_requesting = threading.Barrier(2, timeout=5)
+    ranges = {}
+    downloads = [("https://example.com/resumed", resumed_path), ("https://example.com/fresh", fresh_path)]
+
+    def fake_urlopen(request):
+        # let both downloads build their request before either one proceeds
+        both_requesting.wait()
+        ranges[request.full_url] = request.get_header("Range")
+        return FakeResponse(b"Lama")
+
+    with patch("urllib.request.urlopen", side_effect=fake_urlopen):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(download_file, url, str(path), shared_headers, False) for url, path in downloads]
+            for future in futures:
+                future.result()
+
+    assert shared_headers == {"Authorization": "Bearer token"}
+    assert ranges == {"https://example.com/resumed": "bytes=4-", "https://example.com/fresh": "bytes=0-"}
+    assert resumed_path.read_bytes() == b"RamaLama"
+    assert fresh_path.read_bytes() == b"Lama"
@@ -64,6 +64,11 @@ class TestExtractDefaults:
         defaults = extract_defaults(SimpleConfig)
         assert defaults == {}
 
+    def test_extract_defaults_exclude(self):
+        """Test that excluded fields are skipped, including their default factories."""
+        defaults = extract_defaults(MixedConfigWithDefaults, exclude={"simple", "complex"})
+        assert defaults == {"string_value": "default_string", "int_value": 999}
+
     def test_extract_defaults_mixed_config(self):
         """Test extracting defaults from a mixed config with defaults."""
         defaults = extract_defaults(MixedConfigWithDefaults)
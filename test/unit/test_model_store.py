@@ -1,10 +1,20 @@
 import os
+import threading
+import time
+import urllib.error
+from unittest.mock import patch
 
 import pytest
 
+from ramalama.common import checksum_marker_path, generate_sha256
 from ramalama.model_store.global_store import GlobalModelStore
 from ramalama.model_store.reffile import RefJSONFile, StoreFile, StoreFileType
-from ramalama.model_store.snapshot_file import SnapshotFile, SnapshotFileType, validate_snapshot_files
+from ramalama.model_store.snapshot_file import (
+    LocalSnapshotFile,
+    SnapshotFile,
+    SnapshotFileType,
+    validate_snapshot_files,
+)
 from ramalama.model_store.store import ModelStore
 from ramalama.model_store.template_conversion import wrap_template_with_messages_loop
 
@@ -82,3 +92,142 @@ def test_try_convert_existing_chat_template_converts_flat_jinja(tmp_path, monkey
     converted_file = captured["files"][0]
     assert converted_file.type == SnapshotFileType.ChatTemplate
     assert converted_file.content == wrap_template_with_messages_loop(original_template)
+
+
+def test_verify_snapshot_files_redownloads_only_mismatched_blobs(tmp_path, monkeypatch):
+    global_store = GlobalModelStore(str(tmp_path))
+    model_store = ModelStore(global_store, model_name="sample", model_type="file", model_organization="org")
+    model_store.ensure_directory_setup()
+
+    content = "RamaLama"
+    good_hash = generate_sha256(content)
+    bad_hash = generate_sha256("something else")
+    files = []
+    # "bad-copy" shares its blob with "bad" and must not trigger a second download
+    for file_hash, name in [(good_hash, "good"), (bad_hash, "bad"), (bad_hash, "bad-copy")]:
+        blob_path = model_store.get_blob_file_path(file_hash)
+        with open(blob_path, "w") as blob:
+            blob.write(content)
+        files.append((SnapshotFile("", {}, file_hash, name, SnapshotFileType.Other), blob_path))
+
+    downloaded = []
+
+    def fake_download(self, blob_file_path, snapshot_dir):
+        downloaded.append(self.name)
+        with open(blob_file_path, "w") as blob:
+            blob.write("something else")
+        return ""
+
+    monkeypatch.setattr(SnapshotFile, "download", fake_download)
+
+    model_store._verify_snapshot_files("snap123", files)
+
+    assert downloaded == ["bad"]
+
+
+def test_ref_json_file_from_path_reflects_rewrites(tmp_path):
+    ref_path = str(tmp_path / "latest.json")
+    ref = RefJSONFile(hash="snap123", path=ref_path, files=[StoreFile("hash1", "model", StoreFileType.GGUF_MODEL)])
+    ref.write_to_file()
+
+    first = RefJSONFile.from_path(ref_path)
+    assert first == ref
+    # returned instances must not share state with the cached contents
+    first.files.clear()
+    assert RefJSONFile.from_path(ref_path) == ref
+
+    ref.files.append(StoreFile("hash2", "chat_template", StoreFileType.CHAT_TEMPLATE))
+    ref.write_to_file()
+    assert RefJSONFile.from_path(ref_path) == ref
+
+
+def test_download_snapshot_files_links_all_files(tmp_path):
+    global_store = GlobalModelStore(str(tmp_path))
+    model_store = ModelStore(global_store, model_name="sample", model_type="file", model_organization="org")
+
+    snapshot_hash = "snap123"
+    files = [
+        LocalSnapshotFile("model", "model.gguf", SnapshotFileType.GGUFModel, should_show_progress=True),
+        LocalSnapshotFile("template", "chat_template", SnapshotFileType.ChatTemplate),
+        LocalSnapshotFile("config", "config.json", SnapshotFileType.Other),
+    ]
+    ref = model_store._prepare_new_snapshot("latest", snapshot_hash, files)
+
+    model_store._download_snapshot_files(ref, snapshot_hash, files)
+
+    for file in files:
+        with open(model_store.get_snapshot_file_path(snapshot_hash, file.name)) as f:
+            assert f.read() == file.content
+
+
+@pytest.mark.parametrize(
+    "cached_content,expect_download",
+    [
+        (None, True),
+        ("RamaLama", False),
+        ("Rama", True),
+    ],
+)
+def test_snapshot_file_download_checks_cached_blob_size(tmp_path, cached_content, expect_download):
+    blob_path = tmp_path / "sha256-blob"
+    marker_path = tmp_path / checksum_marker_path("sha256-blob")
+    if cached_content is not None:
+        blob_path.write_text(cached_content)
+        marker_path.write_text("{}")
+
+    file = SnapshotFile("https://example.com/blob", {}, "sha256-blob", "model", SnapshotFileType.GGUFModel, size=8)
+    with patch("ramalama.model_store.snapshot_file.download_file") as download_file:
+        file.download(str(blob_path), str(tmp_path))
+
+    assert download_file.called == expect_download
+    if expect_download:
+        assert not blob_path.exists()
+        assert not marker_path.exists()
+
+
+def test_download_snapshot_files_cancels_background_downloads_after_failure(tmp_path):
+    global_store = GlobalModelStore(str(tmp_path))
+    model_store = ModelStore(global_store, model_name="sample", model_type="file", model_organization="org")
+
+    streaming = threading.Event()
+
+    class StreamingResponse:
+        status = 206
+
+        def __init__(self):
+            # bounded so that a regression fails the test instead of hanging it
+            self.remaining_chunks = 1000
+
+        def getheader(self, name, default=None):
+            return default
+
+        def read(self, size=-1):
+            streaming.set()
+            time.sleep(0.01)
+            self.remaining_chunks -= 1
+            return b"x" * size if self.remaining_chunks > 0 else b""
+
+    class FailingSnapshotFile(SnapshotFile):
+        def download(self, blob_file_path, snapshot_dir, cancel_event=None):
+            # fail only once the background download is underway
+            streaming.wait(5)
+            raise urllib.error.HTTPError(self.url, 500, "Internal Server Error", None, None)
+
+    snapshot_hash = "snap123"
+    files = [
+        FailingSnapshotFile("", {}, "model-hash", "model", SnapshotFileType.GGUFModel, should_show_progress=True),
+        SnapshotFile("https://example.com/config", {}, "config-hash", "config", SnapshotFileType.Other),
+    ]
+    ref = model_store._prepare_new_snapshot("latest", snapshot_hash, files)
+
+    threads_before = set(threading.enumerate())
+    with patch("urllib.request.urlopen", return_value=StreamingResponse()):
+        with pytest.raises(urllib.error.HTTPError):
+            model_store._download_snapshot_files(ref, snapshot_hash, files)
+
+    # the interpreter joins download worker threads on exit, so they have to stop on their own
+    for thread in set(threading.enumerate()) - threads_before:
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+    # the partial download is kept so that the next pull can resume it
+    assert os.path.exists(model_store.get_partial_blob_file_path("config-hash"))
@@ -46,3 +46,26 @@ def test_ollama_model_pull(ollama_model):
     args.quiet = True
     with patch("ramalama.transports.ollama.OllamaRepository", return_value=OllamaRepositoryMock("dummy-model")):
         ollama_model.pull(args)
+
+
+def test_ollama_model_pull_fetches_manifest_once(ollama_model):
+    args.quiet = True
+    manifest = {
+        "config": {"digest": "sha256-2c1ea6b9a0e4a5d0d0a26c9b34d21d6a76b3e2a90f6402a8f4e9ad7a0d5cb1f0"},
+        "layers": [
+            {
+                "mediaType": "application/vnd.ollama.image.model",
+                "digest": "sha256-bf0ecbdb9b814248d086c9b69cf26182d9d4138f2ad3d0637c4555fc8cbf68e5",
+            }
+        ],
+    }
+    with (
+        patch.object(OllamaRepository, "fetch_manifest", return_value=manifest) as fetch_manifest,
+        patch("ramalama.transports.ollama.in_existing_cache", return_value=None),
+        patch.object(ollama_model.model_store, "new_snapshot") as new_snapshot,
+    ):
+        ollama_model.pull(args)
+
+    fetch_manifest.assert_called_once()
+    files = new_snapshot.call_args.args[2]
+    assert [file.name for file in files] == ["llama2", OllamaRepository.FILE_NAME_CONFIG]